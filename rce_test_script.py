@@ -1,4 +1,6 @@
 import os
+import re
+import functools
 import subprocess
 import urllib.parse
 import time
@@ -6,11 +8,13 @@ import logging
 import sys
 import signal
 import json
+import hashlib
 import csv
 import zipfile
 import yaml
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import argparse
 from tqdm import tqdm
@@ -22,6 +26,12 @@ import html
 from tabulate import tabulate
 from colorama import init, Fore, Style
 
+# Prefer the libyaml C parser; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Initialize colorama for colored console output
 init(autoreset=True)
 
@@ -43,12 +53,38 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def load_config_cache(cache_file, cache_key):
+    """Load a cached parsed config if it matches the YAML file's current key."""
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("key") == cache_key:
+            return cached.get("config") or {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable config cache {cache_file}: {str(e)}")
+    return None
+
+def save_config_cache(cache_file, cache_key, config):
+    """Atomically write the parsed config to its JSON sidecar cache."""
+    tmp_file = f"{cache_file}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"key": cache_key, "config": config}, f)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logging.warning(f"Could not write config cache {cache_file}: {str(e)}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
 def load_config(config_file="rce_config.yaml"):
-    """Load configuration from a YAML file if available."""
+    """Load configuration from a YAML file if available, using a JSON sidecar cache when fresh."""
     default_config = {
         "url_file": None,
         "payload_file": None,
-        "max_workers": multiprocessing.cpu_count(),
+        # Workers mostly wait on qsreplace child processes, so size the pool like an I/O-bound one
+        "max_workers": max(32, multiprocessing.cpu_count()),
         "timeout": 30,
         "qsreplace_path": None,
         "gf_path": None,
@@ -57,12 +93,21 @@ def load_config(config_file="rce_config.yaml"):
         "verbose": False,
         "dry_run": False,
         "table_style": "fancy_grid",
-        "max_urls": None
+        "max_urls": None,
+        "compression": "deflate"
     }
     if os.path.isfile(config_file):
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+            stat = os.stat(config_file)
+            cache_file = f"{config_file}.cache.json"
+            cache_key = f"{stat.st_mtime_ns}:{stat.st_size}"
+            config = load_config_cache(cache_file, cache_key)
+            if config is None:
+                if not yaml.__with_libyaml__:
+                    logging.warning("libyaml not available, using slower pure-Python YAML parser. Install libyaml-dev and reinstall pyyaml with: pip install --force-reinstall --no-binary pyyaml pyyaml")
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config = yaml.load(f, Loader=YamlLoader) or {}
+                save_config_cache(cache_file, cache_key, config)
             default_config.update(config)
             logging.info(f"Loaded configuration from {config_file}")
         except Exception as e:
@@ -70,6 +115,7 @@ def load_config(config_file="rce_config.yaml"):
             print(Fore.RED + f"Error loading config {config_file}: {str(e)}")
     return default_config
 
+@functools.lru_cache(maxsize=None)
 def find_command(command, custom_path=None):
     """Dynamically locate a command in PATH or common locations."""
     common_paths = [
@@ -139,43 +185,75 @@ def validate_file(file_path):
         print(Fore.RED + f"Error validating file '{file_path}': {str(e)}")
         return False
 
+# Common http(s) URLs with a plain dotted hostname, an unreserved-character path and a
+# key=value query; anything else (fragments, ';', quotes, bare keys) goes through validators
+SIMPLE_URL_RE = re.compile(
+    r"^https?://(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}(?::[1-9]\d{0,3})?"
+    r"(?:/[a-z0-9\-._~%/]*)?"
+    r"(?:\?[a-z0-9\-._~%+]+=[a-z0-9\-._~%+]*(?:&[a-z0-9\-._~%+]+=[a-z0-9\-._~%+]*)*)?$",
+    re.IGNORECASE
+)
+
+@functools.lru_cache(maxsize=1 << 15)
 def validate_url(url):
     """Validate if a string is a valid URL."""
+    if SIMPLE_URL_RE.match(url):
+        return True
     return validators.url(url) is True
 
+# Characters not allowed in directory and file names, mapped in a single pass
+FILENAME_TRANS = str.maketrans({'/': '_', ':': '_'})
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(dir_path):
+    """Create a directory once per run; later calls for the same path are cache hits."""
+    Path(dir_path).mkdir(exist_ok=True)
+    return dir_path
+
 def create_output_dir(url):
     """Create a directory named after the domain of the URL."""
-    domain = urllib.parse.urlparse(url).netloc.replace(':', '_')
+    domain = urllib.parse.urlparse(url).netloc.translate(FILENAME_TRANS)
     output_dir = f"rce_results_{domain}"
     try:
-        Path(output_dir).mkdir(exist_ok=True)
-        return output_dir
+        return ensure_dir(output_dir)
     except Exception as e:
         logging.error(f"Error creating directory for {url}: {str(e)}")
         print(Fore.RED + f"Error creating directory for {url}: {str(e)}")
         return None
 
-def sanitize_filename(url, payload):
-    """Sanitize URL and payload to create a valid filename with timestamp."""
+def sanitize_url_part(url):
+    """Sanitize a URL for use in filenames; computed once per URL."""
+    # quote() with safe='' already percent-encodes '/' and ':'
+    return urllib.parse.quote(url, safe='')
+
+def sanitize_filename(url_part, payload):
+    """Combine a pre-sanitized URL part, sanitized payload and timestamp into a filename."""
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    url_part = urllib.parse.quote(url, safe='').replace('/', '_').replace(':', '_')
-    payload_part = urllib.parse.quote(payload[:10], safe='').replace('/', '_').replace(':', '_')
-    return f"{url_part}_{payload_part}_{timestamp}"
+    payload_part = urllib.parse.quote(payload[:10], safe='')
+    # Payloads often share a 10-character prefix; a short hash keeps their files apart
+    payload_hash = hashlib.sha256(payload.encode('utf-8', errors='replace')).hexdigest()[:8]
+    return f"{url_part}_{payload_part}_{payload_hash}_{timestamp}"
+
+# Keywords indicating successful command execution, matched against lowercased output
+RCE_KEYWORDS = (
+    "uid=", "gid=", "root:", "etc/passwd", "etc/shadow", "vulnerable", "bash",
+    "whoami", "uname -a", "id:", "successfully executed"
+)
 
 def score_payload_output(output, error):
     """Score payload output for potential RCE success."""
     if error:
         return 0
-    keywords = [
-        "uid=", "gid=", "root:", "etc/passwd", "etc/shadow", "vulnerable", "bash", 
-        "whoami", "uname -a", "id:", "successfully executed"
-    ]
-    score = sum(2 if keyword in output.lower() else 0 for keyword in keywords)
-    if any(cmd in output.lower() for cmd in ["command not found", "permission denied"]):
+    lowered = output.lower()
+    score = 2 * sum(keyword in lowered for keyword in RCE_KEYWORDS)
+    if "command not found" in lowered or "permission denied" in lowered:
         score -= 1
     return max(0, score)
 
-def run_qsreplace(url, payload, output_dir, timeout, args, qsreplace_path):
+# Maximum characters of stdout and of stderr kept per result in memory and in summaries
+OUTPUT_CAP = 64 * 1024
+
+def run_qsreplace(url, payload, output_dir, timeout, args, qsreplace_path, url_part):
     """Run qsreplace with a single payload on a URL and save output."""
     if stop_execution:
         return None
@@ -185,19 +263,24 @@ def run_qsreplace(url, payload, output_dir, timeout, args, qsreplace_path):
             print(Fore.CYAN + f"[Dry Run] Would test {url} with payload {payload[:10]}...")
         return {"url": url, "payload": payload, "status": "dry_run", "output": "", "error": "", "score": 0}
 
-    output_file = os.path.join(output_dir, f"{sanitize_filename(url, payload)}.txt")
+    output_file = os.path.join(output_dir, f"{sanitize_filename(url_part, payload)}.txt")
     result = {"url": url, "payload": payload, "status": "success", "output": "", "error": "", "score": 0}
     logging.info(f"Testing {url} with payload: {payload}")
 
+    # One qsreplace call per (url, payload): qsreplace de-duplicates stdin input, so a
+    # batched run cannot be mapped back to individual URLs, and retries/timeouts stay per pair
+    cmd = [qsreplace_path, "-u", url, payload]
     for attempt in range(args.retries + 1):
         try:
-            cmd = [qsreplace_path, "-u", url, payload]
             process = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-            result["output"] = process.stdout + process.stderr
-            result["score"] = score_payload_output(result["output"], result["error"])
+            full_output = process.stdout + process.stderr
+            result["score"] = score_payload_output(full_output, result["error"])
+            # Keep only a bounded slice in memory; the full output goes to the result file
+            result["output"] = process.stdout[:OUTPUT_CAP] + process.stderr[:OUTPUT_CAP]
+            result["output_sha256"] = hashlib.sha256(full_output.encode('utf-8', errors='replace')).hexdigest()
 
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"URL: {url}\nPayload: {payload}\nScore: {result['score']}\n\nOutput:\n{result['output']}")
+                f.write(f"URL: {url}\nPayload: {payload}\nScore: {result['score']}\n\nOutput:\n{full_output}")
             logging.info(f"Results saved for {url} with payload {payload[:10]} in {output_file}")
             if not args.quiet:
                 color = Fore.RED if result["score"] > 0 else Fore.GREEN
@@ -223,33 +306,43 @@ def run_qsreplace(url, payload, output_dir, timeout, args, qsreplace_path):
     return result
 
 def extract_rce_params(url_file, args, gf_path):
-    """Run the pipeline: cat url_file | gf rce | tee -a rce_all_params.txt"""
+    """Run gf rce on url_file, append its output to rce_all_params.txt and return the valid URLs."""
     if not gf_path:
         logging.warning("gf not available, skipping RCE parameter extraction")
         if not args.quiet:
             print(Fore.YELLOW + "Warning: gf not available, skipping RCE parameter extraction")
         return []
     try:
-        cmd = f"cat {url_file} | {gf_path} rce | tee -a rce_all_params.txt"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            logging.info("RCE parameters extracted and appended to rce_all_params.txt")
-            if not args.quiet:
-                print(Fore.GREEN + "RCE parameters extracted and appended to rce_all_params.txt")
-            try:
-                with open("rce_all_params.txt", 'r', encoding='utf-8') as f:
-                    urls = [line.strip() for line in f.readlines() if line.strip() and validate_url(line.strip())]
-                return list(set(urls))
-            except Exception as e:
-                logging.error(f"Error reading rce_all_params.txt: {str(e)}")
-                if not args.quiet:
-                    print(Fore.RED + f"Error reading rce_all_params.txt: {str(e)}")
-                return []
-        else:
-            logging.error(f"GF pipeline failed: {result.stderr}")
+        # Feed the file straight to gf and tee its output from Python, without a shell
+        urls = {}
+        # stderr goes to a temp file so a chatty gf cannot fill a pipe while we read stdout
+        with open(url_file, 'rb') as url_input, \
+                open("rce_all_params.txt", 'a', encoding='utf-8') as params_out, \
+                tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                [gf_path, "rce"],
+                stdin=url_input,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                encoding='utf-8',
+                errors='replace'
+            ) as process:
+                for line in process.stdout:
+                    params_out.write(line)
+                    url = line.strip()
+                    if url and url not in urls and validate_url(url):
+                        urls[url] = None
+            returncode = process.returncode
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode('utf-8', errors='replace')
+        if returncode != 0:
+            logging.warning(f"gf exited with code {returncode}: {stderr}")
             if not args.quiet:
-                print(Fore.RED + f"Error running gf pipeline: {result.stderr}")
-            return []
+                print(Fore.YELLOW + f"Warning: gf exited with code {returncode}: {stderr}")
+        logging.info(f"Extracted {len(urls)} RCE parameter URLs and appended them to rce_all_params.txt")
+        if not args.quiet:
+            print(Fore.GREEN + f"Extracted {len(urls)} RCE parameter URLs and appended them to rce_all_params.txt")
+        return list(urls)
     except Exception as e:
         logging.error(f"Error in gf pipeline: {str(e)}")
         if not args.quiet:
@@ -258,10 +351,10 @@ def extract_rce_params(url_file, args, gf_path):
 
 def load_urls(url_file, single_url, args):
     """Load URLs from file, stdin, or single URL, streaming to handle large files."""
-    urls = []
+    urls = {}  # Ordered set: keeps first-seen order and drops duplicates while reading
     if single_url:
         if validate_url(single_url):
-            urls = [single_url]
+            urls = {single_url: None}
             logging.info(f"Using single URL: {single_url}")
             if not args.quiet:
                 print(Fore.GREEN + f"Using single URL: {single_url}")
@@ -276,8 +369,8 @@ def load_urls(url_file, single_url, args):
             with open(url_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     url = line.strip()
-                    if url and validate_url(url):
-                        urls.append(url)
+                    if url and url not in urls and validate_url(url):
+                        urls[url] = None
                         if args.max_urls and len(urls) >= args.max_urls:
                             break
             logging.info(f"Loaded {len(urls)} URLs from {url_file}")
@@ -290,15 +383,15 @@ def load_urls(url_file, single_url, args):
     elif not sys.stdin.isatty():
         for line in sys.stdin:
             url = line.strip()
-            if url and validate_url(url):
-                urls.append(url)
+            if url and url not in urls and validate_url(url):
+                urls[url] = None
                 if args.max_urls and len(urls) >= args.max_urls:
                     break
         logging.info(f"Loaded {len(urls)} URLs from stdin")
         if not args.quiet:
             print(Fore.GREEN + f"Loaded {len(urls)} URLs from stdin")
-    
-    return list(set(urls))
+
+    return list(urls)
 
 def load_payloads(payload_file, single_payload, args):
     """Load payloads from a file, single payload, or defaults, streaming to handle large files."""
@@ -311,7 +404,7 @@ def load_payloads(payload_file, single_payload, args):
     elif payload_file and validate_file(payload_file):
         try:
             with open(payload_file, 'r', encoding='utf-8') as f:
-                payloads = [line.strip() for line in f if line.strip()]
+                payloads = list(dict.fromkeys(line.strip() for line in f if line.strip()))
             logging.info(f"Loaded {len(payloads)} payloads from {payload_file}")
             if not args.quiet:
                 print(Fore.GREEN + f"Loaded {len(payloads)} payloads from {payload_file}")
@@ -322,7 +415,7 @@ def load_payloads(payload_file, single_payload, args):
     elif validate_file("payloads.txt"):
         try:
             with open("payloads.txt", 'r', encoding='utf-8') as f:
-                payloads = [line.strip() for line in f if line.strip()]
+                payloads = list(dict.fromkeys(line.strip() for line in f if line.strip()))
             logging.info(f"Loaded {len(payloads)} payloads from default payloads.txt")
             if not args.quiet:
                 print(Fore.GREEN + f"Loaded {len(payloads)} payloads from default payloads.txt")
@@ -361,17 +454,11 @@ def load_payloads(payload_file, single_payload, args):
         logging.info(f"Using {len(payloads)} embedded default payloads")
         if not args.quiet:
             print(Fore.GREEN + f"Using {len(payloads)} embedded default payloads")
-    
-    return list(set(payloads))
 
-def save_summary(results, args):
-    """Save results to JSON, CSV, and HTML files."""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    json_file = f"rce_summary_{timestamp}.json"
-    csv_file = f"rce_summary_{timestamp}.csv"
-    html_file = f"rce_summary_{timestamp}.html"
-    
-    # Save JSON
+    return payloads
+
+def write_json_summary(results, json_file, args):
+    """Write results to a JSON summary file."""
     try:
         with open(json_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2)
@@ -382,10 +469,11 @@ def save_summary(results, args):
         logging.error(f"Error saving JSON summary: {str(e)}")
         print(Fore.RED + f"Error saving JSON summary: {str(e)}")
 
-    # Save CSV
+def write_csv_summary(results, csv_file, args):
+    """Write results to a CSV summary file."""
     try:
         with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["url", "payload", "status", "output", "error", "score"])
+            writer = csv.DictWriter(f, fieldnames=["url", "payload", "status", "output", "error", "score", "output_sha256"])
             writer.writeheader()
             for result in results:
                 writer.writerow(result)
@@ -396,9 +484,10 @@ def save_summary(results, args):
         logging.error(f"Error saving CSV summary: {str(e)}")
         print(Fore.RED + f"Error saving CSV summary: {str(e)}")
 
-    # Save HTML
+def write_html_report(results, html_file, args):
+    """Write results, already sorted by score, to a sortable HTML report."""
     try:
-        html_content = """
+        html_header = """
         <html>
         <head>
             <title>RCE Test Report</title>
@@ -412,37 +501,29 @@ def save_summary(results, args):
             </style>
             <script>
                 function sortTable(n) {
-                    let table = document.getElementById("results");
-                    let switching = true, rows, i, shouldSwitch, dir = "asc", switchcount = 0;
-                    while (switching) {
-                        switching = false;
-                        rows = table.rows;
-                        for (i = 1; i < (rows.length - 1); i++) {
-                            shouldSwitch = false;
-                            let x = rows[i].getElementsByTagName("TD")[n];
-                            let y = rows[i + 1].getElementsByTagName("TD")[n];
-                            let xVal = n === 5 ? parseInt(x.innerHTML) : x.innerHTML.toLowerCase();
-                            let yVal = n === 5 ? parseInt(y.innerHTML) : y.innerHTML.toLowerCase();
-                            if (dir === "asc" && xVal > yVal || dir === "desc" && xVal < yVal) {
-                                shouldSwitch = true;
-                                break;
-                            }
-                        }
-                        if (shouldSwitch) {
-                            rows[i].parentNode.insertBefore(rows[i + 1], rows[i]);
-                            switching = true;
-                            switchcount++;
-                        } else if (switchcount === 0 && dir === "asc") {
-                            dir = "desc";
-                            switching = true;
-                        }
+                    let tbody = document.querySelector("#results tbody");
+                    let rows = Array.from(tbody.rows);
+                    let numeric = n === 5;
+                    rows.sort((a, b) => {
+                        let x = a.cells[n].textContent, y = b.cells[n].textContent;
+                        return numeric ? parseInt(x) - parseInt(y) : x.toLowerCase().localeCompare(y.toLowerCase());
+                    });
+                    if (tbody.dataset.sorted === "asc" + n) {
+                        rows.reverse();
+                        tbody.dataset.sorted = "desc" + n;
+                    } else {
+                        tbody.dataset.sorted = "asc" + n;
                     }
+                    let fragment = document.createDocumentFragment();
+                    rows.forEach(row => fragment.appendChild(row));
+                    tbody.appendChild(fragment);
                 }
             </script>
         </head>
         <body>
             <h1>RCE Test Report</h1>
             <table id="results">
+                <thead>
                 <tr>
                     <th onclick="sortTable(0)">URL</th>
                     <th onclick="sortTable(1)">Payload</th>
@@ -451,11 +532,22 @@ def save_summary(results, args):
                     <th onclick="sortTable(4)">Error</th>
                     <th onclick="sortTable(5)">Score</th>
                 </tr>
+                </thead>
+                <tbody>
+        """
+        html_footer = """
+                </tbody>
+            </table>
+        </body>
+        </html>
         """
-        for result in sorted(results, key=lambda x: x["score"], reverse=True):
-            row_class = "high-score" if result["score"] > 0 else ""
-            output_snippet = html.escape(result["output"][:100] + '...' if len(result["output"]) > 100 else result["output"])
-            html_content += f"""
+        # Stream rows straight to the file rather than building one large string
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(html_header)
+            for result in results:
+                row_class = "high-score" if result["score"] > 0 else ""
+                output_snippet = html.escape(result["output"][:100] + '...' if len(result["output"]) > 100 else result["output"])
+                f.write(f"""
                 <tr class="{row_class}">
                     <td>{html.escape(result["url"])}</td>
                     <td>{html.escape(result["payload"])}</td>
@@ -464,14 +556,8 @@ def save_summary(results, args):
                     <td>{html.escape(result["error"])}</td>
                     <td>{result["score"]}</td>
                 </tr>
-            """
-        html_content += """
-            </table>
-        </body>
-        </html>
-        """
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            """)
+            f.write(html_footer)
         logging.info(f"Saved HTML report to {html_file}")
         if not args.quiet:
             print(Fore.GREEN + f"Saved HTML report to {html_file}")
@@ -479,16 +565,49 @@ def save_summary(results, args):
         logging.error(f"Error saving HTML report: {str(e)}")
         print(Fore.RED + f"Error saving HTML report: {str(e)}")
 
+def save_summary(results, args):
+    """Save results, already sorted by score, to JSON, CSV, and HTML files concurrently."""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_file = f"rce_summary_{timestamp}.json"
+    csv_file = f"rce_summary_{timestamp}.csv"
+    html_file = f"rce_summary_{timestamp}.html"
+
+    # Each writer handles its own errors; overlap their disk writes and HTML escaping
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(write_json_summary, results, json_file, args),
+            executor.submit(write_csv_summary, results, csv_file, args),
+            executor.submit(write_html_report, results, html_file, args)
+        ]
+        for future in futures:
+            future.result()
+
+def iter_result_files(dir_path):
+    """Recursively yield file paths under a result directory using os.scandir."""
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_result_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
 def zip_results(args):
     """Compress result directories into a ZIP file."""
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     zip_file = f"rce_results_{timestamp}.zip"
+    if args.compression == "stored":
+        compression, compresslevel = zipfile.ZIP_STORED, None
+    else:
+        # Level 1 is several times faster than zlib's default at a small size cost
+        compression, compresslevel = zipfile.ZIP_DEFLATED, 1
     try:
-        with zipfile.ZipFile(zip_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for root, _, files in os.walk('.'):
-                if root.startswith('rce_results_'):
-                    for file in files:
-                        zf.write(os.path.join(root, file))
+        with zipfile.ZipFile(zip_file, 'w', compression, compresslevel=compresslevel) as zf:
+            # Only descend into result directories, not the whole working tree
+            with os.scandir('.') as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name.startswith('rce_results_'):
+                        for file_path in iter_result_files(entry.name):
+                            zf.write(file_path)
         logging.info(f"Compressed results to {zip_file}")
         if not args.quiet:
             print(Fore.GREEN + f"Compressed results to {zip_file}")
@@ -508,21 +627,23 @@ def load_state(state_file="rce_state.json"):
     return set()
 
 def save_state(processed_urls, state_file="rce_state.json"):
-    """Save state of processed URLs."""
+    """Atomically save state of processed URLs."""
+    tmp_file = f"{state_file}.tmp"
     try:
-        with open(state_file, 'w', encoding='utf-8') as f:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
             json.dump({"processed_urls": list(processed_urls)}, f)
+        os.replace(tmp_file, state_file)
         logging.info(f"Saved state to {state_file}")
     except Exception as e:
         logging.error(f"Error saving state file {state_file}: {str(e)}")
         print(Fore.RED + f"Error saving state file: {str(e)}")
 
 def print_results(results, args):
-    """Print a tabular summary of results."""
+    """Print a tabular summary of results, already sorted by score."""
     if args.no_print or not results:
         return
     table = []
-    for result in sorted(results, key=lambda x: x["score"], reverse=True):
+    for result in results:
         color = Fore.RED if result["score"] > 0 else Fore.RESET
         output_snippet = result["output"][:50] + '...' if len(result["output"]) > 50 else result["output"]
         table.append([
@@ -539,8 +660,13 @@ def print_results(results, args):
     print(Fore.CYAN + f"Total Results: {len(results)} (High-score results in red)")
     logging.info("Printed results summary")
 
-def process_url(url, payloads, timeout, args, qsreplace_path, processed_urls):
-    """Process a single URL with all payloads."""
+def append_result_stream(result_stream, result):
+    """Append a single result as one compact JSON line and flush it to disk."""
+    result_stream.write(json.dumps(result, separators=(',', ':')) + '\n')
+    result_stream.flush()
+
+def submit_url(url, payloads, timeout, args, qsreplace_path, processed_urls, executor):
+    """Submit all payloads for a single URL to the shared executor and return their futures."""
     if stop_execution or url in processed_urls:
         return []
     if not validate_url(url):
@@ -548,33 +674,13 @@ def process_url(url, payloads, timeout, args, qsreplace_path, processed_urls):
         if not args.quiet:
             print(Fore.YELLOW + f"Skipping invalid URL: {url}")
         return []
-    
+
     output_dir = create_output_dir(url)
     if not output_dir:
         return []
-    
-    results = []
-    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
-        future_to_payload = {executor.submit(run_qsreplace, url, p, output_dir, timeout, args, qsreplace_path): p for p in payloads}
-        for future in tqdm(
-            executor._futures,
-            total=len(payloads),
-            desc=f"Payloads for {url}",
-            leave=False,
-            disable=args.quiet
-        ):
-            try:
-                result = future.result()
-                if result:
-                    results.append(result)
-            except Exception as e:
-                logging.error(f"Error processing payload for {url}: {str(e)}")
-                if not args.quiet:
-                    print(Fore.RED + f"Error processing payload for {url}: {str(e)}")
-                results.append({"url": url, "payload": "", "status": "error", "output": "", "error": str(e), "score": 0})
-    
-    processed_urls.add(url)
-    return results
+    url_part = sanitize_url_part(url)
+
+    return [executor.submit(run_qsreplace, url, p, output_dir, timeout, args, qsreplace_path, url_part) for p in payloads]
 
 def main(args):
     global stop_execution
@@ -602,7 +708,7 @@ def main(args):
     if args.url_file and gf_path:
         gf_urls = extract_rce_params(args.url_file, args, gf_path)
         if gf_urls:
-            urls = list(set(urls + gf_urls))
+            urls = list(dict.fromkeys(urls + gf_urls))
 
     # Filter out processed URLs
     urls = [url for url in urls if url not in processed_urls]
@@ -624,26 +730,78 @@ def main(args):
 
     # Process URLs in batches
     batch_size = 100
+    # Flush state every state_flush_urls URLs or state_flush_seconds, and once at the end
+    state_flush_urls = 50
+    state_flush_seconds = 10
     all_results = []
     start_time = time.time()
-    
-    for i in range(0, len(urls), batch_size):
-        if stop_execution:
-            break
-        batch = urls[i:i + batch_size]
-        for url in tqdm(batch, desc="Processing URLs", unit="URL", disable=args.quiet):
-            try:
-                results = process_url(url, payloads, args.timeout, args, qsreplace_path, processed_urls)
-                all_results.extend(results)
-                save_state(processed_urls)
-            except Exception as e:
-                logging.error(f"Error processing {url}: {str(e)}", exc_info=True)
-                if not args.quiet:
-                    print(Fore.RED + f"Error processing {url}: {str(e)}")
-                all_results.append({"url": url, "payload": "", "status": "error", "output": "", "error": str(e), "score": 0})
-
-    # Save results
+    last_flush = start_time
+    unsaved_urls = 0
+    stream_file = f"rce_stream_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    logging.info(f"Streaming results to {stream_file}")
+    if not args.quiet:
+        print(Fore.GREEN + f"Streaming results to {stream_file}")
+
+    # One long-lived pool shared by all URLs, fed a batch of (url, payload) pairs at a time.
+    # Results are appended to the stream as they complete and drive a single progress bar.
+    total_tests = len(urls) * len(payloads)
+    with open(stream_file, 'a', encoding='utf-8') as result_stream, \
+            ThreadPoolExecutor(max_workers=args.max_workers) as executor, \
+            tqdm(total=total_tests, desc="Testing payloads", unit="test", disable=args.quiet,
+                 miniters=max(1, total_tests // 1000), mininterval=0.2) as pbar:
+        try:
+            for i in range(0, len(urls), batch_size):
+                if stop_execution:
+                    break
+                future_to_url = {}
+                remaining = {}
+                for url in urls[i:i + batch_size]:
+                    try:
+                        futures = submit_url(url, payloads, args.timeout, args, qsreplace_path, processed_urls, executor)
+                    except Exception as e:
+                        logging.error(f"Error processing {url}: {str(e)}", exc_info=True)
+                        if not args.quiet:
+                            print(Fore.RED + f"Error processing {url}: {str(e)}")
+                        result = {"url": url, "payload": "", "status": "error", "output": "", "error": str(e), "score": 0}
+                        all_results.append(result)
+                        append_result_stream(result_stream, result)
+                        futures = []
+                    if not futures:
+                        pbar.update(len(payloads))
+                        continue
+                    remaining[url] = len(futures)
+                    for future in futures:
+                        future_to_url[future] = url
+
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logging.error(f"Error processing payload for {url}: {str(e)}")
+                        if not args.quiet:
+                            print(Fore.RED + f"Error processing payload for {url}: {str(e)}")
+                        result = {"url": url, "payload": "", "status": "error", "output": "", "error": str(e), "score": 0}
+                    if result:
+                        all_results.append(result)
+                        append_result_stream(result_stream, result)
+                    pbar.update(1)
+
+                    # A URL is done once all of its payloads have completed
+                    remaining[url] -= 1
+                    if remaining[url] == 0 and not stop_execution:
+                        processed_urls.add(url)
+                        unsaved_urls += 1
+                        if unsaved_urls >= state_flush_urls or time.time() - last_flush > state_flush_seconds:
+                            save_state(processed_urls)
+                            last_flush = time.time()
+                            unsaved_urls = 0
+        finally:
+            save_state(processed_urls)
+
+    # Save results, sorted once by score for every report
     if all_results:
+        all_results.sort(key=lambda x: x["score"], reverse=True)
         save_summary(all_results, args)
         zip_results(args)
         print_results(all_results, args)
@@ -672,6 +830,7 @@ if __name__ == "__main__":
     parser.add_argument("--resume", action="store_true", help="Resume from previous run using state file")
     parser.add_argument("--no-print", action="store_true", help="Skip printing results table")
     parser.add_argument("--table-style", default=config["table_style"], help="Table style for results (e.g., fancy_grid, simple)")
+    parser.add_argument("--compression", choices=["stored", "deflate"], default=config["compression"], help=f"Compression for the results ZIP (default: {config['compression']})")
     args = parser.parse_args()
 
     if args.verbose: